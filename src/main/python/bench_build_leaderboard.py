@@ -0,0 +1,89 @@
+import argparse
+import os
+import random
+import shlex
+import subprocess
+import tempfile
+import time
+
+from build_leaderboard import HANDLE_COLUMN_OF, PARTICIPANT_HANDLE_COLUMNS, RATING_FILES, build_leaderboard
+
+# Upper bound of generated ratings for each platform, roughly matching the real data
+RATING_RANGES = {
+    "codeforces": 3500,
+    "geeksforgeeks": 2500,
+    "geeksforgeeks_practice": 6000,
+    "leetcode": 3000,
+    "codechef": 3000,
+    "hackerrank": 5000,
+}
+
+
+# Where the Java build_leaderboard reads the participants from, relative to its working directory
+JAVA_PARTICIPANT_DETAILS = os.path.join("src", "main", "resources", "participant_details.csv")
+
+
+def generate_participants(path, participants):
+    """Write a synthetic participant_details.csv in the layout usernameVerifier/main.py writes."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as file:
+        file.write("Handle,GeeksForGeeksHandle,CodeforcesHandle,LeetCodeHandle,CodeChefHandle,HackerRankHandle,"
+                   "GeeksForGeeksURLExists,CodeforcesURLExists,LeetCodeURLExists,CodeChefURLExists,"
+                   "HackerRankURLExists\n")
+        for i in range(participants):
+            handle = f"26r01a{i:06d}"
+            usernames = ",".join(f"{handle}_{platform}" for platform in PARTICIPANT_HANDLE_COLUMNS)
+            file.write(f"{handle},{usernames},True,True,True,True,True\n")
+
+
+def generate_ratings(directory, participants, seed=2026):
+    """Write synthetic *_ratings.txt files for the given number of participants."""
+    rng = random.Random(seed)
+    for platform, file_name in RATING_FILES:
+        with open(os.path.join(directory, file_name), 'w') as file:
+            for i in range(participants):
+                # Not every participant has a handle on every platform
+                if rng.random() < 0.2:
+                    continue
+                handle = f"26r01a{i:06d}"
+                username = f"{handle}_{HANDLE_COLUMN_OF.get(platform, platform)}"
+                file.write(f"{handle},{username},{rng.randint(0, RATING_RANGES[platform])}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the NumPy leaderboard scoring stage.")
+    parser.add_argument("--participants", type=int, default=100_000, help="Number of synthetic participants")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed runs")
+    parser.add_argument("--java-cmd", default=None,
+                        help="Command running the Java build_leaderboard in the ratings directory, e.g. "
+                             "'java -jar /path/to/CMRIT2026Leaderboard-1.0-SNAPSHOT.jar build_leaderboard'. "
+                             "The synthetic participant_details.csv is written where the jar loads its "
+                             "cmrit database from, and the jar creates its own leaderboard database.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        participants_path = os.path.join(directory, JAVA_PARTICIPANT_DETAILS)
+        generate_participants(participants_path, args.participants)
+        generate_ratings(directory, args.participants)
+        print(f"Generated participant details and rating files for {args.participants} participants in {directory}")
+
+        python_times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            build_leaderboard(directory, os.path.join(directory, "leaderboard.csv"), participants_path)
+            python_times.append(time.perf_counter() - start)
+        print(f"Python (NumPy) best of {args.repeat}: {min(python_times):.3f}s")
+
+        if args.java_cmd:
+            java_times = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                subprocess.run(shlex.split(args.java_cmd), cwd=directory, check=True,
+                               stdout=subprocess.DEVNULL)
+                java_times.append(time.perf_counter() - start)
+            print(f"Java best of {args.repeat}: {min(java_times):.3f}s")
+            print(f"Speedup: {min(java_times) / min(python_times):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
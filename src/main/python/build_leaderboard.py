@@ -0,0 +1,239 @@
+import csv
+import os
+import sys
+import time
+import numpy as np
+
+# Participants the Java build_leaderboard seeds its users from, with their platform handles
+PARTICIPANT_DETAILS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'resources',
+                                        'participant_details.csv')
+
+# Platform handle columns of participant_details.csv, after the participant handle
+PARTICIPANT_HANDLE_COLUMNS = ["geeksforgeeks", "codeforces", "leetcode", "codechef", "hackerrank"]
+
+# Rating files in the order the Java buildLeaderboard reads them. Participants are indexed in
+# participant_details.csv order, then in the order new handles appear in these files. Equal
+# percentiles keep that order, while the Java path breaks ties in HashMap order, so tied
+# participants can be ranked differently.
+RATING_FILES = [
+    ("codeforces", "codeforces_ratings.txt"),
+    ("geeksforgeeks", "gfg_ratings.txt"),
+    ("geeksforgeeks_practice", "gfg_practice_ratings.txt"),
+    ("leetcode", "leetcode_ratings.txt"),
+    ("codechef", "codechef_ratings.txt"),
+    ("hackerrank", "hackerrank_ratings.txt"),
+]
+
+# Same weights as the percentile formula in CMRITLeaderboard2026.buildLeaderboard
+WEIGHTS = {
+    "codeforces": 0.3,
+    "geeksforgeeks": 0.3,
+    "geeksforgeeks_practice": 0.1,
+    "leetcode": 0.1,
+    "codechef": 0.1,
+    "hackerrank": 0.1,
+}
+
+# GFG contest and practice scores share the GFG handle column
+HANDLE_COLUMNS = ["codeforces", "geeksforgeeks", "leetcode", "codechef", "hackerrank"]
+HANDLE_COLUMN_OF = {"geeksforgeeks_practice": "geeksforgeeks"}
+
+COLUMNS = ["Rank", "Handle", "Codeforces_Handle", "Codeforces_Rating", "Geeksforgeeks_Handle",
+           "Geeksforgeeks_Rating", "Geeksforgeeks_Practice_Rating", "Leetcode_Handle", "Leetcode_Rating",
+           "Codechef_Handle", "Codechef_Rating", "Hackerrank_Handle", "Hackerrank_Rating", "Percentile"]
+
+
+def load_participants(path=PARTICIPANT_DETAILS_FILE):
+    """
+    Load the participants and their platform handles from participant_details.csv.
+
+    Rows are parsed like the Java loadCSVtoSQL: the header and the trailing "None" and "TOTAL"
+    rows are skipped and columns are taken by position.
+
+    Returns:
+    list: (handle, {platform: username}) tuples in file order, empty if the file can't be read
+    """
+    participants = []
+    try:
+        with open(path, 'r', newline='') as csv_file:
+            reader = csv.reader(csv_file)
+            next(reader, None)
+            for row in reader:
+                if not row or row[0].startswith("None") or row[0].startswith("TOTAL"):
+                    continue
+                usernames = dict(zip(PARTICIPANT_HANDLE_COLUMNS, row[1:1 + len(PARTICIPANT_HANDLE_COLUMNS)]))
+                participants.append((row[0], usernames))
+    except IOError as e:
+        print(f"Error reading participant details file: {e}")
+    return participants
+
+
+def load_ratings(directory=".", participants_path=PARTICIPANT_DETAILS_FILE):
+    """
+    Load every *_ratings.txt file into aligned columns keyed by participant index.
+
+    The index and platform handles are seeded from participant_details.csv, so participants
+    without any rating are still ranked, as in the Java path. A platform handle missing there
+    is taken from the first rating file that has one, the GFG handle from either GFG file.
+
+    Args:
+    directory (str): Directory containing the rating files
+    participants_path (str): participant_details.csv to seed the participants from
+
+    Returns:
+    tuple: (handles, platform_handles, ratings) where handles is a list of participant handles,
+    platform_handles maps a platform to a list of usernames and ratings maps a platform to an
+    int64 NumPy array, all indexed by the same participant index
+    """
+    index = {}
+    handles = []
+    columns = {}
+    seeded = {platform: [] for platform in HANDLE_COLUMNS}
+
+    for handle, usernames in load_participants(participants_path):
+        if handle in index:
+            # Later rows replace earlier ones, as REPLACE INTO users_data does
+            row = index[handle]
+        else:
+            row = len(handles)
+            index[handle] = row
+            handles.append(handle)
+            for platform in HANDLE_COLUMNS:
+                seeded[platform].append("")
+        for platform in HANDLE_COLUMNS:
+            seeded[platform][row] = usernames.get(platform, "")
+
+    for platform, file_name in RATING_FILES:
+        rows = []
+        values = []
+        usernames = []
+        try:
+            with open(os.path.join(directory, file_name), 'r') as file:
+                for line in file:
+                    data = line.rstrip('\n').split(',')
+                    if len(data) < 3:
+                        continue
+                    handle = data[0]
+                    row = index.get(handle)
+                    if row is None:
+                        row = len(handles)
+                        index[handle] = row
+                        handles.append(handle)
+                    rows.append(row)
+                    usernames.append(data[1])
+                    values.append(int(data[2]))
+        except IOError as e:
+            print(f"Error reading {platform} ratings file: {e}")
+        print(f"{platform} ratings read successfully.")
+        columns[platform] = (rows, usernames, values)
+
+    size = len(handles)
+    platform_handles = {platform: names + [""] * (size - len(names)) for platform, names in seeded.items()}
+    ratings = {}
+    for platform, (rows, usernames, values) in columns.items():
+        rows = np.asarray(rows, dtype=np.int64)
+        column = np.zeros(size, dtype=np.int64)
+        # Repeated handles keep the last rating read, as the Java HashMap update does
+        column[rows] = np.asarray(values, dtype=np.int64)
+        ratings[platform] = column
+        target = platform_handles[HANDLE_COLUMN_OF.get(platform, platform)]
+        for row, username in zip(rows.tolist(), usernames):
+            if not target[row]:
+                target[row] = username
+
+    return handles, platform_handles, ratings
+
+
+def compute_percentiles(ratings):
+    """
+    Compute the weighted composite score for every participant in one vectorized pass.
+
+    Each platform rating is normalized against the platform maximum to a 0-100 score and the
+    scores are combined with WEIGHTS. A platform where nobody has a rating contributes 0
+    instead of the NaN the Java division produces.
+
+    Args:
+    ratings (dict): Platform name to int64 NumPy array of ratings
+
+    Returns:
+    numpy.ndarray: float64 array of percentiles indexed by participant
+    """
+    size = len(next(iter(ratings.values()))) if ratings else 0
+    percentiles = np.zeros(size, dtype=np.float64)
+    for platform, weight in WEIGHTS.items():
+        column = ratings.get(platform)
+        if column is None or size == 0:
+            continue
+        maximum = column.max()
+        if maximum <= 0:
+            continue
+        percentiles += column * (100.0 * weight / maximum)
+    return percentiles
+
+
+def rank_participants(percentiles):
+    """
+    Return participant indices ordered by decreasing percentile.
+
+    The sort is stable so participants with equal percentiles keep their load order.
+    """
+    return np.argsort(-percentiles, kind='stable')
+
+
+def build_leaderboard(directory=".", output_path="leaderboard.csv", participants_path=PARTICIPANT_DETAILS_FILE):
+    """
+    Build the sorted leaderboard from the rating files and write it to a CSV file.
+
+    Args:
+    directory (str): Directory containing the rating files
+    output_path (str): Path of the CSV file to write
+    participants_path (str): participant_details.csv to seed the participants from
+
+    Returns:
+    int: Number of participants written
+    """
+    handles, platform_handles, ratings = load_ratings(directory, participants_path)
+    percentiles = compute_percentiles(ratings)
+    order = rank_participants(percentiles)
+
+    # Gather every output column in rank order before writing a single row
+    ranked_handles = [handles[i] for i in order.tolist()]
+    ranked_usernames = {platform: [names[i] for i in order.tolist()] for platform, names in platform_handles.items()}
+    ranked_ratings = {platform: column[order].tolist() for platform, column in ratings.items()}
+    ranked_percentiles = np.round(percentiles[order], 2).tolist()
+
+    with open(output_path, 'w', newline='') as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(COLUMNS)
+        writer.writerows(zip(
+            range(1, len(order) + 1),
+            ranked_handles,
+            ranked_usernames["codeforces"], ranked_ratings["codeforces"],
+            ranked_usernames["geeksforgeeks"], ranked_ratings["geeksforgeeks"],
+            ranked_ratings["geeksforgeeks_practice"],
+            ranked_usernames["leetcode"], ranked_ratings["leetcode"],
+            ranked_usernames["codechef"], ranked_ratings["codechef"],
+            ranked_usernames["hackerrank"], ranked_ratings["hackerrank"],
+            ranked_percentiles,
+        ))
+
+    return len(order)
+
+
+def main():
+    if len(sys.argv) > 4:
+        print("Usage: python build_leaderboard.py [ratings directory] [output csv path] [participant details csv]")
+        return
+
+    directory = sys.argv[1] if len(sys.argv) > 1 else "."
+    output_path = sys.argv[2] if len(sys.argv) > 2 else "leaderboard.csv"
+    participants_path = sys.argv[3] if len(sys.argv) > 3 else PARTICIPANT_DETAILS_FILE
+
+    start = time.perf_counter()
+    count = build_leaderboard(directory, output_path, participants_path)
+    elapsed = time.perf_counter() - start
+    print(f"Leaderboard with {count} participants written to {output_path} in {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
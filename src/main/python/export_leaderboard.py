@@ -0,0 +1,224 @@
+import csv
+import gzip
+import json
+import math
+import os
+import shutil
+import sys
+import tempfile
+
+PAGE_SIZE = 100
+GRAM_SIZE = 3
+# Target number of ranks per search bucket, the bucket count grows with the cohort
+BUCKET_POSTINGS = 4096
+# Keys matching more than this share of the cohort, such as a shared roll number prefix, are
+# not indexed: they narrow nothing down and would make every bucket holding them large
+MAX_KEY_FRACTION = 0.1
+
+# Columns of the leaderboard CSV that are searched from the web frontend
+SEARCH_COLUMNS = ["Handle", "Codeforces_Handle", "Geeksforgeeks_Handle", "Leetcode_Handle", "Codechef_Handle",
+                  "Hackerrank_Handle"]
+
+
+def write_json_gz(path, data):
+    """Write data as compact gzip-compressed JSON. mtime is fixed so unchanged data gives identical bytes."""
+    with open(path, 'wb') as raw:
+        with gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=9, mtime=0) as file:
+            file.write(json.dumps(data, separators=(',', ':')).encode('utf-8'))
+
+
+def search_keys(term):
+    """
+    Return the index keys for a searchable term.
+
+    Prefixes shorter than GRAM_SIZE are stored as "^" + prefix so short queries only match the
+    start of a handle. Longer queries are answered by intersecting the GRAM_SIZE n-grams.
+    """
+    term = term.strip().lower()
+    if not term or term == '#n/a':
+        return set()
+    keys = {"^" + term[:length] for length in range(1, min(GRAM_SIZE, len(term) + 1))}
+    keys.update(term[i:i + GRAM_SIZE] for i in range(len(term) - GRAM_SIZE + 1))
+    return keys
+
+
+def fnv1a_32(text):
+    """32-bit FNV-1a hash of the UTF-8 bytes of text, simple to compute the same way in the frontend."""
+    value = 0x811c9dc5
+    for byte in text.encode('utf-8'):
+        value = ((value ^ byte) * 0x01000193) & 0xffffffff
+    return value
+
+
+def bucket_name(key, buckets):
+    """
+    Return the search bucket of an index key, its FNV-1a hash modulo the bucket count.
+
+    A query fetches one bucket per key it has that is not a common key, at most one for a
+    query of up to GRAM_SIZE characters and one per n-gram for a longer one. Buckets stay
+    around BUCKET_POSTINGS ranks whatever the cohort size.
+    """
+    return f"{fnv1a_32(key) % buckets:05d}"
+
+
+def check_output_dir(leaderboard_path, output_dir):
+    """
+    Raise ValueError if output_dir is not safe to replace with a fresh export.
+
+    The directory is deleted and swapped for the new shards, so it must not be the working
+    directory or one of its parents, must not hold the input CSV, and if it already exists it
+    must be empty or a previous export (it has a manifest.json).
+    """
+    output_path = os.path.realpath(output_dir)
+    if os.path.commonpath([output_path, os.getcwd()]) == output_path:
+        raise ValueError(f"Refusing to replace {output_dir}: it is the working directory or one of its parents")
+    if os.path.commonpath([output_path, os.path.realpath(leaderboard_path)]) == output_path:
+        raise ValueError(f"Refusing to replace {output_dir}: it contains the input {leaderboard_path}")
+    if os.path.exists(output_dir):
+        if not os.path.isdir(output_dir):
+            raise ValueError(f"Refusing to replace {output_dir}: it is not a directory")
+        if os.listdir(output_dir) and not os.path.isfile(os.path.join(output_dir, 'manifest.json')):
+            raise ValueError(f"Refusing to replace {output_dir}: it is not empty and holds no previous export")
+
+
+def export_leaderboard(leaderboard_path, output_dir, page_size=PAGE_SIZE):
+    """
+    Export a ranked leaderboard CSV as static JSON shards for the web frontend.
+
+    The output directory contains:
+    - manifest.json: columns, participant count, page size, the bucket count and the common keys
+    - pages/page-NNNNN.json.gz: rows ordered by rank, page_size rows per page
+    - search/NNNNN.json.gz: n-gram and prefix keys mapped to sorted lists of ranks, the bucket
+      of a key is its bucket_name. Buckets no key hashes to are not written.
+
+    The rank of a search hit gives its page directly as (rank - 1) // page_size, so the
+    frontend only downloads the buckets for the query and the pages holding the hits. Keys
+    listed in common_keys are left out of the index, a query made only of common keys is
+    too broad to answer from it.
+
+    Args:
+    leaderboard_path (str): CSV written by build_leaderboard.py, already sorted by rank
+    output_dir (str): Directory to write the shards to, replaced if it exists, see check_output_dir
+    page_size (int): Number of rows per page shard
+
+    Returns:
+    dict: The manifest that was written
+    """
+    if page_size < 1:
+        raise ValueError(f"page_size must be at least 1, got {page_size}")
+    check_output_dir(leaderboard_path, output_dir)
+
+    # Write into a fresh directory next to output_dir and swap it in at the end, so a failed
+    # export leaves the previous shards in place and pages left over from a larger cohort
+    # are not served
+    parent = os.path.dirname(os.path.abspath(output_dir))
+    os.makedirs(parent, exist_ok=True)
+    staging_dir = tempfile.mkdtemp(prefix=f'.{os.path.basename(os.path.abspath(output_dir))}-', dir=parent)
+    # mkdtemp creates the directory private to the user, the shards are served as static files
+    os.chmod(staging_dir, 0o755)
+    try:
+        manifest = write_shards(leaderboard_path, staging_dir, page_size)
+    except BaseException:
+        shutil.rmtree(staging_dir)
+        raise
+
+    if os.path.isdir(output_dir):
+        old_dir = staging_dir + '-old'
+        os.rename(output_dir, old_dir)
+        os.rename(staging_dir, output_dir)
+        shutil.rmtree(old_dir)
+    else:
+        os.rename(staging_dir, output_dir)
+    return manifest
+
+
+def write_shards(leaderboard_path, output_dir, page_size):
+    """Write the manifest, page and search shards of export_leaderboard into an empty output_dir."""
+    pages_dir = os.path.join(output_dir, 'pages')
+    search_dir = os.path.join(output_dir, 'search')
+    os.makedirs(pages_dir)
+    os.makedirs(search_dir)
+
+    index = {}
+    total = 0
+    page_number = 0
+    page = []
+
+    with open(leaderboard_path, 'r', newline='') as csv_file:
+        reader = csv.reader(csv_file)
+        columns = next(reader)
+        rank_column = columns.index("Rank")
+        search_columns = [columns.index(name) for name in SEARCH_COLUMNS if name in columns]
+
+        for row in reader:
+            if not row:
+                continue
+            total += 1
+            rank = int(row[rank_column])
+            page.append(row)
+
+            for column in search_columns:
+                for key in search_keys(row[column]):
+                    postings = index.setdefault(key, [])
+                    # The same key can come from several handles of one participant
+                    if not postings or postings[-1] != rank:
+                        postings.append(rank)
+
+            if len(page) == page_size:
+                page_number += 1
+                write_json_gz(os.path.join(pages_dir, f'page-{page_number:05d}.json.gz'), page)
+                page = []
+
+    if page:
+        page_number += 1
+        write_json_gz(os.path.join(pages_dir, f'page-{page_number:05d}.json.gz'), page)
+
+    common_keys = sorted(key for key, postings in index.items() if len(postings) > MAX_KEY_FRACTION * total)
+    for key in common_keys:
+        del index[key]
+
+    buckets = max(1, math.ceil(sum(len(postings) for postings in index.values()) / BUCKET_POSTINGS))
+    shards = {}
+    for key, postings in index.items():
+        shards.setdefault(bucket_name(key, buckets), {})[key] = postings
+    for bucket, keys in shards.items():
+        write_json_gz(os.path.join(search_dir, f'{bucket}.json.gz'), keys)
+
+    manifest = {
+        "columns": columns,
+        "total": total,
+        "page_size": page_size,
+        "pages": page_number,
+        "gram_size": GRAM_SIZE,
+        "search_columns": [columns[column] for column in search_columns],
+        "bucket_hash": "fnv1a-32",
+        "buckets": buckets,
+        "common_keys": common_keys,
+    }
+    with open(os.path.join(output_dir, 'manifest.json'), 'w') as file:
+        json.dump(manifest, file, indent=2)
+
+    return manifest
+
+
+def main():
+    if len(sys.argv) not in (3, 4):
+        print("Usage: python export_leaderboard.py <leaderboard csv> <output directory> [page size]")
+        return
+
+    page_size = int(sys.argv[3]) if len(sys.argv) == 4 else PAGE_SIZE
+    if page_size < 1:
+        print("Usage: python export_leaderboard.py <leaderboard csv> <output directory> [page size]")
+        print("The page size must be at least 1")
+        sys.exit(1)
+    try:
+        manifest = export_leaderboard(sys.argv[1], sys.argv[2], page_size)
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
+    print(f"Exported {manifest['total']} participants into {manifest['pages']} pages and "
+          f"{manifest['buckets']} search buckets in {sys.argv[2]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,11 @@
+import heapq
 import os
 import time
 import sqlite3
 import urllib.parse
 import json
-import requests
-from ratelimiter import RateLimiter
-import undetected_chromedriver as uc
-from selenium.webdriver.common.by import By
+
+# ratelimiter, selenium and undetected_chromedriver are only imported once scraping starts
 
 def fetch_true_leetcode_handles(db_name):
     true_leetcode = []
@@ -34,8 +33,114 @@ def fetch_true_leetcode_handles(db_name):
 
     return true_leetcode
 
+class CircuitBreaker:
+    """
+    Stop requesting LeetCode after consecutive failures.
+
+    After failure_threshold consecutive failures wait() sleeps for cooldown seconds, then a single
+    half-open request decides whether to close the circuit or wait another cooldown. Once
+    wait_budget seconds have been spent waiting, an open circuit refuses requests instead.
+    """
+
+    def __init__(self, failure_threshold=5, cooldown=60, wait_budget=300):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.wait_budget = wait_budget
+        self.failures = 0
+        self.opened_at = None
+
+    def wait(self):
+        """
+        Sleep out the rest of the cooldown while the circuit is open.
+
+        Returns False, without sleeping, when the cooldown has not passed and the wait budget is
+        spent. The request must then be skipped.
+        """
+        if self.opened_at is not None:
+            remaining = self.cooldown - (time.monotonic() - self.opened_at)
+            if remaining > 0:
+                if remaining > self.wait_budget:
+                    return False
+                self.wait_budget -= remaining
+                time.sleep(remaining)
+        return True
+
+    def record(self, success):
+        if success:
+            self.failures = 0
+            self.opened_at = None
+            return
+        self.failures += 1
+        # A failed half-open request reopens the circuit straight away
+        if self.failures >= self.failure_threshold or self.opened_at is not None:
+            if self.opened_at is None:
+                print(f"LeetCode failed {self.failures} times in a row, pausing requests for {self.cooldown}s")
+            self.opened_at = time.monotonic()
+
+
+def load_previous_ratings(file_name="leetcode_ratings.txt"):
+    """Read the ratings of the previous run, used when a rating cannot be fetched this time."""
+    previous = {}
+    try:
+        with open(file_name, "r") as file:
+            for line in file:
+                data = line.strip().split(",")
+                if len(data) == 3:
+                    previous[(data[0], data[1])] = data[2]
+    except IOError:
+        pass
+    return previous
+
+
+def write_report(stats, wall_time, path="leetcode_scrape_report.json"):
+    """
+    Write the scrape run report in the same format as the usernameVerifier run report.
+
+    exists counts fetched ratings, not_found handles without a contest ranking and transient
+    handles whose rating could not be fetched (kept from the previous run or skipped). The
+    scraper makes no conditional requests and its retries are done by the workflow, so
+    cache_hit_rate and retries are null, meaning not applicable.
+    """
+    outcomes = stats["outcomes"]
+    handles = sum(outcomes.values())
+    answered = outcomes.get("exists", 0) + outcomes.get("not_found", 0)
+    report = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "script": "src/main/python/scrape_leetcode.py",
+        "wall_time": round(wall_time, 3),
+        "platforms": {
+            "leetcode": {
+                "wall_time": round(wall_time, 3),
+                "requests": stats["requests"],
+                "requests_per_second": round(stats["requests"] / wall_time, 3) if wall_time else 0.0,
+                "cache_hit_rate": None,
+                "retries": None,
+                "handles": handles,
+                "outcomes": outcomes,
+                "coverage": round(answered / handles, 4) if handles else 0.0,
+                "slowest": [{"handle": handle, "seconds": round(seconds, 3)}
+                            for seconds, handle in sorted(stats["slowest"], reverse=True)],
+            }
+        },
+    }
+    with open(path + ".tmp", "w") as file:
+        json.dump(report, file, indent=2)
+    os.replace(path + ".tmp", path)
+    print(f"Run report written to {path}")
+
+
 def scrape_leetcode(true_leetcode):
+    import undetected_chromedriver as uc
+    from ratelimiter import RateLimiter
+    from selenium.webdriver.common.by import By
+
     print("Leetcode scraping in progress...")
+    run_start = time.perf_counter()
+    # Counters for the run report
+    stats = {"requests": 0, "outcomes": {}, "slowest": []}
+
+    previous_ratings = load_previous_ratings()
+    breaker = CircuitBreaker()
 
     # Create or clear the file for writing
     with open("leetcode_ratings.txt", "w") as file:
@@ -43,6 +148,8 @@ def scrape_leetcode(true_leetcode):
 
     counter = 1
     size = len(true_leetcode)
+    # Handles that could not be fetched and have no previous rating to fall back on
+    missing = 0
 
     # Rate limit the function to a maximum of 2 requests per second
     limiter = RateLimiter(max_calls=MAX_REQUESTS_PER_SECOND, period=1)
@@ -90,40 +197,74 @@ def scrape_leetcode(true_leetcode):
         encoded_leetcode_handle = urllib.parse.quote(leetcode_handle, safe='')
         url = LEETCODE_URL.replace("{<username>}", encoded_leetcode_handle)
         url = url.replace(" ", "%20")
-        try:
-            with limiter:
-                headers = None
-                print("URL:", url)
-                driver.get(url)
-
-                # Parse JSON response
-                json_content = driver.find_element(By.TAG_NAME, "pre").text
-
-                # convert JSON CONTENT TO JSON PARSEABLE OBJECT
-                json_content = json.loads(json_content)
-
-                try:
-                    # Get rating from JSON response
-                    rating = json_content['data']['userContestRanking']['rating']
-                except TypeError:
-                    # Handle NoneType error
-                    print(f"Rating for {handle} with leetcode handle {leetcode_handle} not found.")
-                    rating = 0
-
-                rating = round(float(rating))
-                # Print rating information
-                print(f"({counter}/{size}) Leetcode rating for {handle} with leetcode handle {leetcode_handle} is: {rating}")
-
-                # Write to text file
-                with open("leetcode_ratings.txt", "a") as file:
-                    file.write(f"{handle},{leetcode_handle},{rating}\n")
+        rating = None
+        outcome = "transient"
+        start = time.perf_counter()
+        if not breaker.wait():
+            # The circuit is still open and the waiting budget is spent, the previous rating is kept below
+            print(f"Skipping {handle} with leetcode handle {leetcode_handle}, LeetCode circuit open")
+        else:
+            try:
+                with limiter:
+                    print("URL:", url)
+                    stats["requests"] += 1
+                    driver.get(url)
+
+                    # Parse JSON response
+                    json_content = driver.find_element(By.TAG_NAME, "pre").text
 
+                    # convert JSON CONTENT TO JSON PARSEABLE OBJECT
+                    json_content = json.loads(json_content)
+
+                    try:
+                        # Get rating from JSON response
+                        rating = json_content['data']['userContestRanking']['rating']
+                        outcome = "exists"
+                    except TypeError:
+                        # Handle NoneType error
+                        print(f"Rating for {handle} with leetcode handle {leetcode_handle} not found.")
+                        rating = 0
+                        outcome = "not_found"
+
+                    rating = round(float(rating))
+                breaker.record(True)
+            except Exception as e:
+                # Transient or blocked response, the previous rating is kept below
+                print(f"Error fetching leetcode rating for {handle} with leetcode handle {leetcode_handle}: {e}")
+                breaker.record(False)
+                rating = None
+                outcome = "transient"
+
+        stats["outcomes"][outcome] = stats["outcomes"].get(outcome, 0) + 1
+        # Keep the 10 slowest handles in a min-heap
+        entry = (time.perf_counter() - start, handle)
+        if len(stats["slowest"]) < 10:
+            heapq.heappush(stats["slowest"], entry)
+        else:
+            heapq.heappushpop(stats["slowest"], entry)
+
+        if rating is None:
+            rating = previous_ratings.get((handle, leetcode_handle))
+            if rating is None:
+                print(f"({counter}/{size}) No rating for {handle} with leetcode handle {leetcode_handle}, skipped")
+                missing += 1
                 counter += 1
+                continue
+            print(f"({counter}/{size}) Keeping previous rating {rating} for {handle} with leetcode handle {leetcode_handle}")
+        else:
+            # Print rating information
+            print(f"({counter}/{size}) Leetcode rating for {handle} with leetcode handle {leetcode_handle} is: {rating}")
+
+        # Write to text file
+        with open("leetcode_ratings.txt", "a") as file:
+            file.write(f"{handle},{leetcode_handle},{rating}\n")
 
-        except Exception as e:
-            # Error handling
-            raise RuntimeError(f"Error fetching leetcode rating for {handle} with leetcode handle {leetcode_handle}: {e}")
+        counter += 1
 
+    write_report(stats, time.perf_counter() - run_start)
+    # Fail the run so the workflow retries it instead of dropping these participants from the file
+    if missing:
+        raise RuntimeError(f"{missing} Leetcode handles could not be fetched and have no previous rating")
     print("Leetcode scraping completed.")
 
 # Constants
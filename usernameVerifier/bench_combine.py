@@ -0,0 +1,67 @@
+import argparse
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def generate_inputs(directory, rows, seed=2026):
+    """Write a synthetic participant sheet and per platform result files with the given number of rows."""
+    from main import PLATFORM_RESULT_FILES
+
+    rng = random.Random(seed)
+    sheet_path = os.path.join(directory, 'sheet.csv')
+    with open(sheet_path, 'w') as file:
+        file.write("Roll number,GeeksForGeeks,Codeforces,LeetCode,CodeChef,HackerRank\n")
+        for i in range(rows):
+            handle = f"26r01a{i:07d}"
+            file.write(f"{handle},{handle},{handle},{handle},{handle},{handle}\n")
+    for _, file_name in PLATFORM_RESULT_FILES:
+        with open(os.path.join(directory, file_name), 'w') as file:
+            for i in rng.sample(range(rows), rows):
+                handle = f"26r01a{i:07d}"
+                file.write(f"{handle}, {handle}, {rng.choice([True, False])}\n")
+    return sheet_path
+
+
+def run_single(rows):
+    """Time one combine of the given size in this process and print the time and peak RSS."""
+    from main import combine_results, iter_csv_sheet
+
+    with tempfile.TemporaryDirectory() as directory:
+        sheet_path = generate_inputs(directory, rows)
+        os.chdir(directory)
+        start = time.perf_counter()
+        combine_results(iter_csv_sheet(sheet_path), destination=os.path.join(directory, 'participant_details.csv'))
+        elapsed = time.perf_counter() - start
+    # ru_maxrss is in kilobytes on Linux
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{rows},{elapsed:.3f},{peak_mb:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the streaming combine_results.")
+    parser.add_argument("--rows", type=int, nargs='+', default=[1000, 10000, 100000, 1000000],
+                        help="Cohort sizes to benchmark")
+    parser.add_argument("--single", type=int, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single is not None:
+        run_single(args.single)
+        return
+
+    # Every size runs in a fresh process so the peak RSS of one size does not hide another
+    print(f"{'rows':>10} {'seconds':>10} {'us/row':>10} {'peak MB':>10}")
+    for rows in args.rows:
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), "--single", str(rows)],
+                                cwd=os.path.dirname(os.path.abspath(__file__)), check=True,
+                                capture_output=True, text=True).stdout
+        _, elapsed, peak_mb = output.strip().splitlines()[-1].split(',')
+        print(f"{rows:>10} {float(elapsed):>10.3f} {float(elapsed) / rows * 1e6:>10.1f} {float(peak_mb):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import argparse
+import http.server
+import logging
+import os
+import tempfile
+import threading
+import time
+
+import main
+
+
+class MockProfileHandler(http.server.BaseHTTPRequestHandler):
+    """Serves every profile as an existing page after a fixed latency."""
+    latency = 0.05
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        body = b"<html><head><title>Profile | Mock</title></head><body>profile</body></html>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_mock_server(latency):
+    MockProfileHandler.latency = latency
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), MockProfileHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(participants, mode, workers, rate):
+    """Run process_geeksforgeeks in the current directory against the mock server, return (seconds, output lines)."""
+    main.executor = mode
+    main.workers = workers
+    main.rate_limiter = main.RateLimit(rate) if mode == 'threads' else None
+    main.verification_state = {}
+    main.validators = {}
+    if os.path.exists('geeksforgeeks_handles.txt'):
+        os.remove('geeksforgeeks_handles.txt')
+    start = time.perf_counter()
+    main.process_geeksforgeeks(participants)
+    elapsed = time.perf_counter() - start
+    with open('geeksforgeeks_handles.txt') as file:
+        lines = file.readlines()
+    return elapsed, lines
+
+
+def run_benchmark():
+    parser = argparse.ArgumentParser(description="Benchmark the sequential and thread-pool executors on a mock server.")
+    parser.add_argument("--participants", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds the mock server waits per request")
+    parser.add_argument("--workers", type=int, nargs='+', default=[4, 8, 16])
+    parser.add_argument("--rate", type=main.positive_float, default=1000.0, help="Shared requests per second in threads mode")
+    args = parser.parse_args()
+
+    server = start_mock_server(args.latency)
+    main.PROFILE_URLS['geeksforgeeks'] = f"http://127.0.0.1:{server.server_port}/user/"
+    participants = [main.Participant(f"26r01a{i:04d}", f"gfg{i}", "#N/A", "#N/A", "#N/A", "#N/A")
+                    for i in range(args.participants)]
+
+    # The handles file and debug log are written to the working directory
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            sequential_time, sequential_lines = run(participants, 'sequential', 1, args.rate)
+            print(f"{'sequential':>12}: {sequential_time:7.2f}s  {args.participants / sequential_time:7.1f} handles/s")
+            for workers in args.workers:
+                elapsed, lines = run(participants, 'threads', workers, args.rate)
+                same_order = "same order" if lines == sequential_lines else "ORDER DIFFERS"
+                print(f"{f'threads x{workers}':>12}: {elapsed:7.2f}s  {args.participants / elapsed:7.1f} handles/s  "
+                      f"{sequential_time / elapsed:5.1f}x  {same_order}")
+        finally:
+            logging.shutdown()
+            os.chdir(cwd)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    run_benchmark()
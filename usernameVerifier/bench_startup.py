@@ -0,0 +1,60 @@
+import argparse
+import os
+import subprocess
+import sys
+
+# Modules each kind of run imports. "eager" is what main.py used to import for every run.
+SCENARIOS = {
+    "combine": ["main"],
+    "codeforces": ["main", "requests"],
+    "geeksforgeeks": ["main", "requests", "tqdm"],
+    "eager": ["main", "requests", "bs4", "openpyxl", "tqdm", "selenium.webdriver.common.by",
+              "undetected_chromedriver", "ratelimiter"],
+}
+
+
+def import_time(modules):
+    """
+    Import the modules in a fresh interpreter with -X importtime.
+
+    Returns:
+    tuple: (total cumulative microseconds of the top level imports, sorted list of
+    (microseconds, module) for the slowest top level imports)
+    """
+    code = "; ".join(f"import {module}" for module in modules)
+    output = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            cwd=os.path.dirname(os.path.abspath(__file__)),
+                            capture_output=True, text=True)
+    if output.returncode != 0:
+        raise RuntimeError(output.stderr.strip().splitlines()[-1])
+
+    top_level = []
+    for line in output.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nested imports are indented below the package that imported them
+        if name.startswith(" ") and not name.startswith("  "):
+            top_level.append((int(cumulative), name.strip()))
+    return sum(time for time, _ in top_level), sorted(top_level, reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure main.py cold-start import time with python -X importtime.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per scenario, the best one is reported")
+    parser.add_argument("--top", type=int, default=3, help="Slowest top level imports to list per scenario")
+    args = parser.parse_args()
+
+    for scenario, modules in SCENARIOS.items():
+        try:
+            runs = [import_time(modules) for _ in range(args.repeat)]
+        except RuntimeError as e:
+            print(f"{scenario:>14}: failed ({e})")
+            continue
+        total, slowest = min(runs)
+        details = ", ".join(f"{name} {time / 1000:.1f}ms" for time, name in slowest[:args.top])
+        print(f"{scenario:>14}: {total / 1000:8.1f} ms  ({details})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import argparse
+import json
+import sys
+
+
+def relative_change(old, new):
+    if not old:
+        return 0.0
+    return (new - old) / old
+
+
+def compare_reports(old_report, new_report, threshold=0.2, coverage_threshold=0.02):
+    """
+    Compare two run reports platform by platform.
+
+    Args:
+    old_report (dict): Report of the baseline run
+    new_report (dict): Report of the run being checked
+    threshold (float): Relative change in requests/sec, wall time or handles counted as a regression
+    coverage_threshold (float): Absolute drop in coverage counted as a regression
+
+    Returns:
+    tuple: (lines, regressions) where lines describe every compared metric and regressions
+    lists the ones that crossed a threshold
+    """
+    lines = []
+    regressions = []
+    old_platforms = old_report.get("platforms", {})
+    new_platforms = new_report.get("platforms", {})
+
+    for platform in sorted(set(old_platforms) | set(new_platforms)):
+        old = old_platforms.get(platform)
+        new = new_platforms.get(platform)
+        if old is None:
+            lines.append(f"{platform}: new in this run")
+            continue
+        if new is None:
+            regressions.append(f"{platform}: missing from this run")
+            continue
+
+        # (metric, sign of a change that is a regression)
+        for metric, worse in (("requests_per_second", -1), ("wall_time", 1), ("handles", -1)):
+            # Metrics a report leaves out or marks not applicable (null) are not compared
+            if old.get(metric) is None or new.get(metric) is None:
+                lines.append(f"{platform}: {metric} not compared")
+                continue
+            change = relative_change(old[metric], new[metric])
+            line = f"{platform}: {metric} {old[metric]} -> {new[metric]} ({change:+.1%})"
+            lines.append(line)
+            if change * worse > threshold:
+                regressions.append(line)
+
+        if old.get("coverage") is not None and new.get("coverage") is not None:
+            line = f"{platform}: coverage {old['coverage']:.2%} -> {new['coverage']:.2%}"
+            lines.append(line)
+            if old["coverage"] - new["coverage"] > coverage_threshold:
+                regressions.append(line)
+
+        old_outcomes = old.get("outcomes") or {}
+        new_outcomes = new.get("outcomes") or {}
+        for outcome in sorted(set(old_outcomes) | set(new_outcomes)):
+            lines.append(f"{platform}: {outcome} {old_outcomes.get(outcome, 0)} -> {new_outcomes.get(outcome, 0)}")
+
+    return lines, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Diff two run reports and flag throughput or coverage regressions.")
+    parser.add_argument("old", help="Run report of the baseline run")
+    parser.add_argument("new", help="Run report of the run to check")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Relative change in requests/sec, wall time or handles flagged as a regression")
+    parser.add_argument("--coverage-threshold", type=float, default=0.02,
+                        help="Absolute drop in coverage flagged as a regression")
+    args = parser.parse_args()
+
+    with open(args.old) as file:
+        old_report = json.load(file)
+    with open(args.new) as file:
+        new_report = json.load(file)
+
+    lines, regressions = compare_reports(old_report, new_report, args.threshold, args.coverage_threshold)
+    print(f"Comparing {args.old} ({old_report.get('generated_at')}) with {args.new} ({new_report.get('generated_at')})")
+    for line in lines:
+        print(line)
+    if regressions:
+        print("\nREGRESSIONS:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    print("\nNo regressions.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,9 @@
+import argparse
+import collections
+import concurrent.futures
 import csv
 import hashlib
+import heapq
 import json
 import logging
 import os
@@ -7,15 +11,13 @@ import re
 import string
 import random
 import sys
+import tempfile
+import threading
 import time
-import requests
 import urllib.parse
-from bs4 import BeautifulSoup
-from openpyxl import load_workbook
-from ratelimiter import RateLimiter
-from selenium.webdriver.common.by import By
-from tqdm import tqdm
-import undetected_chromedriver as uc
+
+# requests, bs4, openpyxl, tqdm, selenium, undetected_chromedriver and ratelimiter are imported
+# inside the functions that use them, so combine and codeforces runs do not pay for a browser stack
 
 LEETCODE_QUERY = '''
 https://leetcode.com/graphql?query=query
@@ -76,21 +78,389 @@ def remove_non_ascii(input_string):
     return re.sub(r'[\t\n\x0B\f\r]+', '', input_string)
 
 
-def check_url_exists(url):
+# Validators (ETag / Last-Modified) of previously seen profile pages, keyed by URL
+VALIDATORS_FILE = 'http_validators.json'
+validators = {}
+# Per platform counters of conditional requests for the bytes and time saved report
+conditional_stats = {}
+
+
+def platform_of(url):
+    host = urllib.parse.urlparse(url).netloc
+    for platform in ('geeksforgeeks', 'codechef', 'hackerrank', 'codeforces', 'leetcode'):
+        if platform in host:
+            return platform
+    return host
+
+
+def load_validators(path=VALIDATORS_FILE):
+    """Load the stored validators of earlier runs, if any."""
+    global validators
+    try:
+        with open(path, 'r') as file:
+            validators = json.load(file)
+    except (IOError, ValueError):
+        validators = {}
+    return validators
+
+
+def save_validators(path=VALIDATORS_FILE):
+    """Write the validators atomically so an interrupted run does not corrupt them."""
+    with open(path + '.tmp', 'w') as file:
+        json.dump(validators, file)
+    os.replace(path + '.tmp', path)
+
+
+class RateLimit:
+    """Thread-safe rate limiter spacing requests at least 1 / rate seconds apart across all threads."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self.lock = threading.Lock()
+        self.next_slot = 0.0
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+# Shared by every thread when set, see main()
+rate_limiter = None
+# Each thread keeps its own requests.Session so connections are pooled without sharing a session
+thread_local = threading.local()
+stats_lock = threading.Lock()
+
+
+def http_session():
+    import requests
+
+    session = getattr(thread_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        thread_local.session = session
+    return session
+
+
+def http_get(url, **kwargs):
+    """GET a URL on this thread's pooled session, waiting for the shared rate limiter first."""
+    if rate_limiter is not None:
+        rate_limiter.wait()
+    return http_session().get(url, **kwargs)
+
+
+def conditional_get(url, headers=None):
+    """
+    GET a profile URL, revalidating it with the validators stored from an earlier run.
+
+    Returns:
+    tuple: (response, cached) where cached is the stored entry when the server answered
+    304 Not Modified, otherwise None
+    """
+    headers = dict(headers or {})
+    entry = validators.get(url)
+    if entry:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+    response = http_get(url, headers=headers)
+    elapsed = response.elapsed.total_seconds()
+    not_modified = response.status_code == 304 and entry
+    with stats_lock:
+        stats = conditional_stats.setdefault(platform_of(url), {
+            'requests': 0, 'not_modified': 0, 'bytes_downloaded': 0, 'bytes_saved': 0, 'seconds_saved': 0.0})
+        stats['requests'] += 1
+        stats['bytes_downloaded'] += len(response.content)
+        if not_modified:
+            stats['not_modified'] += 1
+            stats['bytes_saved'] += max(entry['size'] - len(response.content), 0)
+            stats['seconds_saved'] += max(entry['elapsed'] - elapsed, 0.0)
+
+    if not_modified:
+        return response, entry
+    return response, None
+
+
+def remember_validators(url, response):
+    """Store the validators of a profile that exists so the next run can revalidate it."""
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if not etag and not last_modified:
+        validators.pop(url, None)
+        return
+    validators[url] = {
+        'etag': etag,
+        'last_modified': last_modified,
+        'url': response.url,
+        'size': len(response.content),
+        'elapsed': response.elapsed.total_seconds(),
+    }
+
+
+def print_conditional_report():
+    """Print the bytes and time saved by conditional requests for each platform."""
+    for platform, stats in conditional_stats.items():
+        print(f"{platform}: {stats['not_modified']} / {stats['requests']} profiles not modified, "
+              f"{stats['bytes_downloaded']} bytes downloaded, {stats['bytes_saved']} bytes and "
+              f"{stats['seconds_saved']:.2f}s saved")
+        logging.info(f"Conditional requests for {platform}: {stats}")
+
+
+# Per platform counters for the machine readable run report, see write_report
+REPORT_FILE = 'run_report.json'
+SLOWEST_HANDLES = 10
+run_stats = {}
+
+
+def platform_stats(platform):
+    """Return the report counters of a platform, callers hold stats_lock."""
+    if platform not in run_stats:
+        run_stats[platform] = {'wall_time': 0.0, 'requests': 0, 'retries': 0, 'outcomes': {}, 'slowest': []}
+    return run_stats[platform]
+
+
+def count_request(platform):
+    with stats_lock:
+        platform_stats(platform)['requests'] += 1
+
+
+def count_outcome(platform, handle, outcome, seconds=None):
+    """Count a handle per outcome class and keep the SLOWEST_HANDLES slowest checks in a min-heap."""
+    with stats_lock:
+        stats = platform_stats(platform)
+        stats['outcomes'][outcome] = stats['outcomes'].get(outcome, 0) + 1
+        if seconds is not None:
+            entry = (seconds, handle)
+            if len(stats['slowest']) < SLOWEST_HANDLES:
+                heapq.heappush(stats['slowest'], entry)
+            else:
+                heapq.heappushpop(stats['slowest'], entry)
+
+
+def build_report(total_wall_time):
+    """
+    Build the run report from run_stats and conditional_stats.
+
+    Coverage is the share of checked handles that got an answer (exists or not found) rather
+    than a transient or blocked result. cache_hit_rate is None for platforms that made no
+    conditional requests.
+    """
+    platforms = {}
+    for platform, stats in run_stats.items():
+        outcomes = dict(stats['outcomes'])
+        handles = sum(outcomes.values())
+        answered = outcomes.get(ProbeResult.EXISTS, 0) + outcomes.get(ProbeResult.NOT_FOUND, 0)
+        conditional = conditional_stats.get(platform, {})
+        platforms[platform] = {
+            'wall_time': round(stats['wall_time'], 3),
+            'requests': stats['requests'],
+            'requests_per_second': round(stats['requests'] / stats['wall_time'], 3) if stats['wall_time'] else 0.0,
+            'cache_hit_rate': round(conditional['not_modified'] / conditional['requests'], 4)
+            if conditional.get('requests') else None,
+            'retries': stats['retries'],
+            'handles': handles,
+            'outcomes': outcomes,
+            'coverage': round(answered / handles, 4) if handles else 0.0,
+            'slowest': [{'handle': handle, 'seconds': round(seconds, 3)}
+                        for seconds, handle in sorted(stats['slowest'], reverse=True)],
+        }
+    return {
+        'generated_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'script': 'usernameVerifier/main.py',
+        'wall_time': round(total_wall_time, 3),
+        'platforms': platforms,
+    }
+
+
+def write_report(total_wall_time, path=REPORT_FILE):
+    with open(path + '.tmp', 'w') as file:
+        json.dump(build_report(total_wall_time), file, indent=2)
+    os.replace(path + '.tmp', path)
+    print(f"Run report written to {path}")
+
+
+class ProbeResult:
+    """
+    Outcome of probing a profile URL.
+
+    EXISTS and NOT_FOUND are answers about the handle. TRANSIENT (network errors, 5xx) and
+    BLOCKED (403, 429, captcha pages) say nothing about the handle, so callers keep the
+    previously known status for them instead of marking the handle as missing.
+    """
+    EXISTS = 'exists'
+    NOT_FOUND = 'not_found'
+    TRANSIENT = 'transient'
+    BLOCKED = 'blocked'
+
+    def __init__(self, status, response_url):
+        self.status = status
+        self.response_url = response_url
+
+    @property
+    def exists(self):
+        return self.status == ProbeResult.EXISTS
+
+    @property
+    def failed(self):
+        return self.status in (ProbeResult.TRANSIENT, ProbeResult.BLOCKED)
+
+    def __repr__(self):
+        return f"ProbeResult({self.status}, {self.response_url})"
+
+
+def classify_status_code(status_code):
+    """Classify HTTP status codes that do not depend on the platform."""
+    if status_code in (403, 429):
+        return ProbeResult.BLOCKED
+    if status_code >= 500:
+        return ProbeResult.TRANSIENT
+    return None
+
+
+class CircuitBreaker:
+    """
+    Stop probing a platform after consecutive transient or blocked results.
+
+    After failure_threshold consecutive failures the breaker opens and allow() refuses probes
+    for cooldown seconds. It then lets a single half-open probe through: success closes it again,
+    failure reopens it for another cooldown.
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, platform, failure_threshold=5, cooldown=60):
+        self.platform = platform
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = CircuitBreaker.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        # Probes may run on several threads at once
+        self.lock = threading.Lock()
+
+    def allow(self):
+        with self.lock:
+            if self.state == CircuitBreaker.HALF_OPEN:
+                # Only one half-open probe at a time
+                return False
+            if self.state == CircuitBreaker.OPEN:
+                if time.monotonic() - self.opened_at < self.cooldown:
+                    return False
+                self.state = CircuitBreaker.HALF_OPEN
+                logging.info(f"Circuit for {self.platform} half-open, sending a probe")
+            return True
+
+    def ready(self):
+        """Return whether allow() would let a probe through, without taking the half-open probe."""
+        with self.lock:
+            if self.state == CircuitBreaker.OPEN:
+                return time.monotonic() - self.opened_at >= self.cooldown
+            return self.state == CircuitBreaker.CLOSED
+
+    def wait(self, until):
+        """
+        Sleep until the circuit lets a probe through, at the latest until the monotonic time until.
+
+        Returns:
+        bool: False when until or the run deadline is reached first
+        """
+        while not self.ready():
+            if deadline_reached() or time.monotonic() >= until:
+                return False
+            time.sleep(CIRCUIT_POLL_INTERVAL)
+        return True
+
+    def record(self, result):
+        with self.lock:
+            self._record(result)
+
+    def _record(self, result):
+        if not result.failed:
+            if self.state != CircuitBreaker.CLOSED:
+                logging.info(f"Circuit for {self.platform} closed")
+            self.state = CircuitBreaker.CLOSED
+            self.failures = 0
+            return
+        self.failures += 1
+        if self.state == CircuitBreaker.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != CircuitBreaker.OPEN:
+                print(f"Circuit for {self.platform} opened after {self.failures} failures, "
+                      f"pausing probes for {self.cooldown}s")
+                logging.warning(f"Circuit for {self.platform} opened after {self.failures} failures")
+            self.state = CircuitBreaker.OPEN
+            self.opened_at = time.monotonic()
+
+
+# Seconds between checks of an open circuit while waiting for its cooldown
+CIRCUIT_POLL_INTERVAL = 0.5
+# Seconds a platform run may spend in total waiting for an open circuit before re-probing
+CIRCUIT_WAIT_BUDGET = 300
+circuit_breakers = {}
+circuit_breakers_lock = threading.Lock()
+
+
+def circuit_breaker(platform):
+    with circuit_breakers_lock:
+        if platform not in circuit_breakers:
+            circuit_breakers[platform] = CircuitBreaker(platform)
+        return circuit_breakers[platform]
+
+
+def probe_url(url):
+    """
+    Probe a profile URL and classify the outcome.
+
+    Args:
+    url (str): Profile or API URL of a handle
+
+    Returns:
+    ProbeResult: The classified outcome. When the platform's circuit is open the URL is not
+    requested and a TRANSIENT result with response URL "CircuitOpen" is returned straight away,
+    see profile_results for how these are probed again.
+    """
+    breaker = circuit_breaker(platform_of(url))
+    if not breaker.allow():
+        return ProbeResult(ProbeResult.TRANSIENT, "CircuitOpen")
+    result = None
+    try:
+        result = _probe_url(url)
+    finally:
+        # An unexpected exception counts as a failure, so a half-open circuit reopens instead of
+        # staying half-open and blocking every other probe of the platform
+        breaker.record(result if result is not None else ProbeResult(ProbeResult.TRANSIENT, "Exception"))
+    return result
+
+
+def _probe_url(url):
+    import requests
+
     # if url is leeetcode
     if "https://leetcode.com/" in url:
         try:
-            response = requests.get(url)
+            response = http_get(url)
+            status = classify_status_code(response.status_code)
+            if status:
+                return ProbeResult(status, response.url)
             if response.status_code == 200:
                 # read response as json
-                response_json = response.json()
+                try:
+                    response_json = response.json()
+                except ValueError:
+                    # A non JSON page is a captcha or a block page, not an answer about the handle
+                    return ProbeResult(ProbeResult.BLOCKED, response.url)
                 # if the response contains the key "errors", then the handle does not exist
                 if response_json.get("errors"):
-                    return False, response.url
-                return True, response.url
-            return False, response.url
+                    return ProbeResult(ProbeResult.NOT_FOUND, response.url)
+                return ProbeResult(ProbeResult.EXISTS, response.url)
+            return ProbeResult(ProbeResult.NOT_FOUND, response.url)
         except requests.exceptions.RequestException:
-            return False, "Exception"
+            return ProbeResult(ProbeResult.TRANSIENT, "Exception")
     header = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8",
@@ -102,27 +472,51 @@ def check_url_exists(url):
     }
     # if url is hackerrank
     if "https://www.hackerrank.com/" in url:
+        from bs4 import BeautifulSoup
+
         try:
-            response = requests.get(url, headers=header)
+            response, cached = conditional_get(url, headers=header)
+            # A 304 means the profile page is unchanged, so it still exists
+            if cached:
+                return ProbeResult(ProbeResult.EXISTS, cached['url'])
+            status = classify_status_code(response.status_code)
+            if status:
+                return ProbeResult(status, response.url)
             soup = BeautifulSoup(response.text, 'html.parser')
+            # A page without a title is a captcha or a block page, not a profile
+            if soup.title is None:
+                return ProbeResult(ProbeResult.BLOCKED, response.url)
             # Extract the title of the page
             title = soup.title.string
             print(title)
             # Hackerrank handles that do not exist have the title "HTTP 404: Page Not Found | HackerRank"
             # But the title in beautiful soup is "Programming Problems and Competitions :: HackerRank"
             # If user exists, title will be " Name - User Profile | HackerRank"
-            
-            return True, response.url
+            if response.status_code == 200:
+                remember_validators(url, response)
+            return ProbeResult(ProbeResult.EXISTS, response.url)
         except requests.exceptions.RequestException:
-            return False, "Exception"
+            return ProbeResult(ProbeResult.TRANSIENT, "Exception")
     if "https://code-chef-rating-api.vercel.app/" in url:
-        response = requests.get(url)
-        # if success is true in the response json
-        if response.json().get("success"):
-            return True, response.url
-        return False, response.url
+        try:
+            response = http_get(url)
+            status = classify_status_code(response.status_code)
+            if status:
+                return ProbeResult(status, response.url)
+            # if success is true in the response json
+            if response.json().get("success"):
+                return ProbeResult(ProbeResult.EXISTS, response.url)
+            return ProbeResult(ProbeResult.NOT_FOUND, response.url)
+        except (requests.exceptions.RequestException, ValueError):
+            return ProbeResult(ProbeResult.TRANSIENT, "Exception")
     try:
-        response = requests.get(url, headers=header)
+        response, cached = conditional_get(url, headers=header)
+        # A 304 means the profile page is unchanged, so it still exists
+        if cached:
+            return ProbeResult(ProbeResult.EXISTS, cached['url'])
+        status = classify_status_code(response.status_code)
+        if status:
+            return ProbeResult(status, response.url)
         if response.status_code == 200:
             # Check if the final URL is the same as the original URL (no redirect), if redirected, then URL does not
             # exist codeforces redirect is found by checking if final url is https://codeforces.com/ geeksforgeeks
@@ -134,12 +528,309 @@ def check_url_exists(url):
             if (response.url == "https://codeforces.com/" or response.url == ("https://auth.geeksforgeeks.org/?to=https"
                                                                               "://auth.geeksforgeeks.org/profile.php")
                     or response.url == "https://www.codechef.com/"):
-                return False, response.url
+                validators.pop(url, None)
+                return ProbeResult(ProbeResult.NOT_FOUND, response.url)
             else:
-                return True, response.url
-        return False, response.url
+                remember_validators(url, response)
+                return ProbeResult(ProbeResult.EXISTS, response.url)
+        return ProbeResult(ProbeResult.NOT_FOUND, response.url)
     except requests.exceptions.RequestException:
-        return False, "Exception"
+        return ProbeResult(ProbeResult.TRANSIENT, "Exception")
+
+
+def check_url_exists(url):
+    """Return (exists, response_url) for a profile URL, see probe_url for the classified result."""
+    result = probe_url(url)
+    return result.exists, result.response_url
+
+
+# Last verification result of every participant per platform, used to prioritise the next run
+STATE_FILE = 'verification_state.json'
+verification_state = {}
+# Absolute time.monotonic() value after which no new verification work is started
+deadline = None
+
+
+def load_state(path=STATE_FILE):
+    """Load the verification results of earlier runs, if any."""
+    global verification_state
+    try:
+        with open(path, 'r') as file:
+            verification_state = json.load(file)
+    except (IOError, ValueError):
+        verification_state = {}
+    return verification_state
+
+
+def save_state(path=STATE_FILE):
+    """Write the verification results atomically so an interrupted run does not corrupt them."""
+    with open(path + '.tmp', 'w') as file:
+        json.dump(verification_state, file)
+    os.replace(path + '.tmp', path)
+
+
+def record_result(platform, participant, exists, response_url, status=None, written=None):
+    """
+    Remember the result of a participant so later runs can schedule around it.
+
+    exists is the probe's answer. written is the value put in the handles file, which is the
+    same unless the platform writer overrides it, and is what a cut short run carries over.
+    """
+    verification_state.setdefault(platform, {})[participant.handle] = {
+        'handle': getattr(participant, f'{platform}_handle'),
+        'exists': exists,
+        'written': exists if written is None else written,
+        'response_url': response_url,
+        'status': status,
+        'checked_at': time.time(),
+    }
+
+
+# Last combined results committed to the repository, the fallback when there is no verification state
+PARTICIPANT_DETAILS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'main',
+                                        'resources', 'participant_details.csv')
+published_status = {}
+
+
+def load_published_status(path=PARTICIPANT_DETAILS_FILE):
+    """
+    Load the per platform handle and URL exists status of every participant in participant_details.csv.
+
+    Returns:
+    dict: platform -> participant handle -> (platform handle, exists)
+    """
+    global published_status
+    published_status = {}
+    platforms = ['geeksforgeeks', 'codeforces', 'leetcode', 'codechef', 'hackerrank']
+    try:
+        with open(path, 'r', newline='') as file:
+            reader = csv.reader(file)
+            next(reader, None)  # Skip the header row
+            for row in reader:
+                if len(row) != 1 + 2 * len(platforms):
+                    continue
+                for index, platform in enumerate(platforms):
+                    published_status.setdefault(platform, {})[row[0]] = (row[1 + index],
+                                                                         row[1 + len(platforms) + index] == 'True')
+    except IOError:
+        pass
+    return published_status
+
+
+def last_known_status(platform, participant):
+    """
+    Return the last known URL exists status of an unchanged handle, None when there is none.
+
+    The verification state of earlier runs is used first, then participant_details.csv, whose
+    handles have had their spaces removed by combine_results.
+    """
+    platform_handle = getattr(participant, f'{platform}_handle')
+    previous = verification_state.get(platform, {}).get(participant.handle)
+    if previous and previous['handle'] == platform_handle:
+        return previous['exists']
+    published = published_status.get(platform, {}).get(participant.handle.replace(' ', ''))
+    if published and published[0] == platform_handle.replace(' ', ''):
+        return published[1]
+    return None
+
+
+# Platforms whose writer puts this value in the handles file whatever the probe result
+WRITTEN_STATUS = {'codechef': True, 'hackerrank': True}
+
+
+def settle_result(platform, participant, result, written=None):
+    """
+    Record a probe result and return the status to write for the participant.
+
+    Transient and blocked results keep the last known status of an unchanged handle, see
+    last_known_status, and are recorded as failures so the next run retries them first. Only
+    handles with no known status at all are written as False. The written value defaults to
+    the platform's WRITTEN_STATUS, see record_result.
+    """
+    if written is None:
+        written = WRITTEN_STATUS.get(platform)
+    if result.failed:
+        known = last_known_status(platform, participant)
+        exists = known if known is not None else False
+        logging.debug(f"{platform} probe for {participant.handle} was {result.status}, keeping status {exists}")
+    else:
+        exists = result.exists
+    record_result(platform, participant, exists, result.response_url, result.status, written)
+    return exists
+
+
+def priority(platform, participant):
+    """
+    Return the scheduling priority of a participant, lower runs first.
+
+    0: new participants and participants whose platform handle was edited
+    1: participants whose last check failed, raised an exception or was transient or blocked
+    2: verified participants, the stalest first
+    """
+    previous = verification_state.get(platform, {}).get(participant.handle)
+    if previous is None or previous['handle'] != getattr(participant, f'{platform}_handle'):
+        return 0, 0.0
+    if (not previous['exists'] or previous['response_url'] == "Exception"
+            or previous.get('status') in (ProbeResult.TRANSIENT, ProbeResult.BLOCKED)):
+        return 1, previous['checked_at']
+    return 2, previous['checked_at']
+
+
+def deadline_reached():
+    return deadline is not None and time.monotonic() >= deadline
+
+
+def scheduled(participants, platform, file_name):
+    """
+    Yield participants in priority order until the run deadline is reached.
+
+    Python's sort is stable, so participants of equal priority keep sheet order. When the
+    deadline is reached, participants that were not checked get the line the platform writer
+    would write from their last known status copied to file_name: the platform's
+    WRITTEN_STATUS, else last_known_status. Participants
+    with a '#N/A' handle or no known status are left out, as combine_results writes False for
+    them anyway.
+    """
+    queue = sorted(participants, key=lambda participant: priority(platform, participant))
+    for position, participant in enumerate(queue):
+        if deadline_reached():
+            remaining = queue[position:]
+            carried_over = 0
+            with open(file_name, 'a') as file:
+                for skipped in remaining:
+                    platform_handle = getattr(skipped, f'{platform}_handle')
+                    if platform_handle == '#N/A':
+                        continue
+                    written = WRITTEN_STATUS.get(platform)
+                    if written is None:
+                        written = last_known_status(platform, skipped)
+                    if written is not None:
+                        file.write(f"{skipped.handle}, {platform_handle}, {written}\n")
+                        carried_over += 1
+            print(f"Deadline reached: {len(remaining)} {platform} participants not checked, "
+                  f"{carried_over} previous results carried over")
+            logging.warning(f"Deadline reached with {len(remaining)} {platform} participants left")
+            return
+        yield participant
+
+
+# Profile URL prefixes of the platforms verified with probe_url
+PROFILE_URLS = {
+    'geeksforgeeks': "https://auth.geeksforgeeks.org/user/",
+    'codechef': "https://www.codechef.com/users/",
+    'hackerrank': "https://www.hackerrank.com/profile/",
+}
+
+# How profile_results runs the probes, set from --executor, --workers and --rate
+executor = 'sequential'
+workers = 1
+THREAD_REQUESTS_PER_SECOND = 10
+
+
+def check_profile(platform, participant):
+    """
+    Probe the profile of a participant on a platform, retrying once if it does not exist.
+
+    Results refused by an open circuit are not counted in the run report, profile_results
+    counts them once it has given up probing them again.
+    """
+    url = PROFILE_URLS[platform] + getattr(participant, f'{platform}_handle')
+    start = time.perf_counter()
+    result = probe_url(url)
+    logging.debug(f"{platform} URL check for participant {participant.handle}: {result}")
+    if result.response_url != "CircuitOpen":
+        count_request(platform)
+    if not result.exists:
+        logging.debug(f"Retrying {platform} URL check for participant {participant.handle}")
+        with stats_lock:
+            platform_stats(platform)['retries'] += 1
+        result = probe_url(url)
+        logging.debug(f"{platform} URL retry for participant {participant.handle}: {result}")
+        if result.response_url != "CircuitOpen":
+            count_request(platform)
+    if result.response_url != "CircuitOpen":
+        count_outcome(platform, participant.handle, result.status, time.perf_counter() - start)
+    return result
+
+
+def profile_results(participants, platform, file_name):
+    """
+    Yield (participant, ProbeResult) in priority order, None instead of a result for '#N/A' handles.
+
+    Participants refused by the platform's open circuit are held back and probed again at the
+    end, in rounds that each wait for the cooldown so the first probe of a round is the
+    half-open probe. The waiting is capped at CIRCUIT_WAIT_BUDGET seconds for the whole run and
+    stops at the deadline. Participants still refused after that are yielded with their
+    "CircuitOpen" result, so they are written with their last known status.
+    """
+    deferred = []
+    yield from probe_profiles(scheduled(participants, platform, file_name), platform, deferred)
+
+    # The same breaker probe_url uses for the platform's profile URLs
+    breaker = circuit_breaker(platform_of(PROFILE_URLS[platform]))
+    wait_until = time.monotonic() + CIRCUIT_WAIT_BUDGET
+    while deferred:
+        retry, deferred = deferred, []
+        if not breaker.wait(wait_until):
+            logging.warning(f"Circuit for {platform} still open, {len(retry)} participants keep their last status")
+            for participant in retry:
+                count_outcome(platform, participant.handle, ProbeResult.TRANSIENT)
+                yield participant, ProbeResult(ProbeResult.TRANSIENT, "CircuitOpen")
+            return
+        yield from probe_profiles(until_deadline(retry, deferred), platform, deferred)
+
+
+def until_deadline(participants, skipped):
+    """Yield participants until the run deadline is reached, the rest are added to skipped."""
+    for position, participant in enumerate(participants):
+        if deadline_reached():
+            skipped.extend(participants[position:])
+            return
+        yield participant
+
+
+def probe_profiles(queue, platform, deferred):
+    """
+    Yield (participant, ProbeResult) for the participants of queue, see profile_results.
+
+    Participants refused by an open circuit are added to deferred instead of being yielded.
+    With the sequential executor each profile is probed in turn. With the threads executor
+    the probes run on a thread pool of `workers` threads that share the rate limiter, while
+    results are still yielded in submission order, so the output file has the same order as
+    a sequential run. At most 2 * workers probes are in flight, which lets the deadline in
+    scheduled() stop the run without queueing the rest of the cohort.
+    """
+    def needs_probe(participant):
+        return getattr(participant, f'{platform}_handle') != '#N/A'
+
+    def settled(participant, result):
+        if result is not None and result.response_url == "CircuitOpen":
+            deferred.append(participant)
+            return False
+        return True
+
+    if executor != 'threads':
+        for participant in queue:
+            result = check_profile(platform, participant) if needs_probe(participant) else None
+            if settled(participant, result):
+                yield participant, result
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        in_flight = collections.deque()
+        for participant in queue:
+            future = pool.submit(check_profile, platform, participant) if needs_probe(participant) else None
+            in_flight.append((participant, future))
+            while len(in_flight) >= 2 * workers:
+                participant, future = in_flight.popleft()
+                result = future.result() if future else None
+                if settled(participant, result):
+                    yield participant, result
+        while in_flight:
+            participant, future = in_flight.popleft()
+            result = future.result() if future else None
+            if settled(participant, result):
+                yield participant, result
 
 
 def process_geeksforgeeks(participants):
@@ -152,6 +843,8 @@ def process_geeksforgeeks(participants):
     Returns:
     None
     """
+    from tqdm import tqdm
+
     # Configure logging
     logging.basicConfig(filename='geeksforgeeks_debug.log', level=logging.DEBUG)
 
@@ -159,24 +852,14 @@ def process_geeksforgeeks(participants):
     last_user_status = None
     last_user_handle = None
 
-    # Iterate through each participant
-    with tqdm(participants, desc="Processing GeeksForGeeks Handles", unit="participant") as pbar:
-        for participant in pbar:
-            # Check if GeeksForGeeks handle is valid
-            if participant.geeksforgeeks_handle != '#N/A':
-                logging.debug(f"Checking GeeksForGeeks URL for participant {participant.handle}")
-
-                # Check if the GeeksForGeeks URL exists
-                geeksforgeeks_url_exists, response_url = check_url_exists(
-                    "https://auth.geeksforgeeks.org/user/" + participant.geeksforgeeks_handle)
-                logging.debug(f"GeeksForGeeks URL exists: {geeksforgeeks_url_exists}, Response URL: {response_url}")
-
-                # Retry if the GeeksForGeeks URL does not exist
-                if not geeksforgeeks_url_exists and participant.geeksforgeeks_handle != '#N/A':
-                    logging.debug(f"Retrying GeeksForGeeks URL check for participant {participant.handle}")
-                    geeksforgeeks_url_exists, response_url = check_url_exists(
-                        "https://auth.geeksforgeeks.org/user/" + participant.geeksforgeeks_handle)
-                    logging.debug(f"GeeksForGeeks URL retry: {geeksforgeeks_url_exists}, Response URL: {response_url}")
+    # Iterate in priority order so a run cut short has checked the most valuable handles
+    with tqdm(profile_results(participants, 'geeksforgeeks', 'geeksforgeeks_handles.txt'), total=len(participants),
+              desc="Processing GeeksForGeeks Handles", unit="participant") as pbar:
+        for participant, result in pbar:
+            # Check if GeeksForGeeks handle is valid, the URL was checked (and retried) by profile_results
+            if result is not None:
+                # Transient failures keep the previously known status
+                geeksforgeeks_url_exists = settle_result('geeksforgeeks', participant, result)
 
                 # Write participant data to file
                 with open('geeksforgeeks_handles.txt', 'a') as file:
@@ -219,10 +902,14 @@ def process_leetcode(participants):
 
     Note: The function assumes that the LeetCode API query is defined in the LEETCODE_QUERY variable and the maximum number of requests per second is defined in the MAX_REQUESTS_PER_SECOND variable.
 
-    Raises:
-    - RuntimeError: If there is an error parsing the JSON response or getting the content for a participant.
-    - Exception: If there is an error processing the LeetCode handle for a participant.
+    Errors parsing the response or loading the page do not stop the run. They are classified as blocked or
+    transient, the participant keeps their previous status and the LeetCode circuit breaker pauses probing
+    after repeated failures.
     """
+    import undetected_chromedriver as uc
+    from ratelimiter import RateLimiter
+    from selenium.webdriver.common.by import By
+
     # Configure logging
     counter = 1
     size = len(participants)
@@ -261,44 +948,74 @@ def process_leetcode(participants):
     except Exception as e:
         print(f"Error: {e}")
 
-    for participant in participants:
-        handle = participant.handle
-        leetcode_handle = participant.leetcode_handle
+    breaker = circuit_breaker('leetcode')
+
+    def probe(participant):
         # Construct URL for API request
-        encoded_leetcode_handle = urllib.parse.quote(leetcode_handle, safe='')
+        encoded_leetcode_handle = urllib.parse.quote(participant.leetcode_handle, safe='')
         url = LEETCODE_QUERY.replace("{<username>}", encoded_leetcode_handle)
         url = url.replace(" ", "%20")
+        if not breaker.allow():
+            # LeetCode's circuit is open, the participant is probed again at the end
+            return ProbeResult(ProbeResult.TRANSIENT, "CircuitOpen")
+        result = ProbeResult(ProbeResult.TRANSIENT, "Exception")
         try:
             with limiter:
+                count_request('leetcode')
                 driver.get(url)
 
                 # Parse JSON response
                 try:
                     json_content = driver.find_element(By.TAG_NAME, "pre").text
                     json_content = json.loads(json_content)
-                except Exception as e:
-                    raise RuntimeError(f"Error parsing JSON response for {handle} with LeetCode handle {leetcode_handle}: {e}")
-
-                try:
                     # Check if the response contains error
                     if json_content.get("errors"):
-                        with open('leetcode_handles.txt', 'a') as file:
-                            file.write(f"{handle}, {leetcode_handle}, False\n")
-                        print(f"( {counter} / {size} ) Data written to file for participant {handle}: {leetcode_handle}, False")
-                        print("---------------------------------------------------")
-                        counter += 1
-                        continue
+                        result = ProbeResult(ProbeResult.NOT_FOUND, url)
                     else:
-                        with open('leetcode_handles.txt', 'a') as file:
-                            file.write(f"{handle}, {leetcode_handle}, True\n")
-                        print(f"( {counter} / {size} ) Data written to file for participant {handle}: {leetcode_handle}, True")
-                        print("---------------------------------------------------")
-                        counter += 1
-                except (KeyError, TypeError) as e:
-                    raise RuntimeError(f"Error getting content for {handle} with LeetCode handle {leetcode_handle}: {e}")
+                        result = ProbeResult(ProbeResult.EXISTS, url)
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
+                    # A page without the JSON body is a captcha or block page
+                    print(f"Error parsing JSON response for {participant.handle} with LeetCode handle "
+                          f"{participant.leetcode_handle}: {e}")
+                    result = ProbeResult(ProbeResult.BLOCKED, url)
         except Exception as e:
-            raise RuntimeError(f"Error processing LeetCode handle for {handle}: {e}")
-            
+            print(f"Error processing LeetCode handle for {participant.handle}: {e}")
+        finally:
+            breaker.record(result)
+        return result
+
+    def write(participant, result, seconds=None):
+        nonlocal counter
+        count_outcome('leetcode', participant.handle, result.status, seconds)
+        # Transient failures keep the previously known status
+        leetcode_url_exists = settle_result('leetcode', participant, result)
+        with open('leetcode_handles.txt', 'a') as file:
+            file.write(f"{participant.handle}, {participant.leetcode_handle}, {leetcode_url_exists}\n")
+        print(f"( {counter} / {size} ) Data written to file for participant {participant.handle}: "
+              f"{participant.leetcode_handle}, {leetcode_url_exists} ({result.status})")
+        print("---------------------------------------------------")
+        counter += 1
+
+    # Iterate in priority order so a run cut short has checked the most valuable handles
+    deferred = []
+    for participant in scheduled(participants, 'leetcode', 'leetcode_handles.txt'):
+        start = time.perf_counter()
+        result = probe(participant)
+        if result.response_url == "CircuitOpen":
+            deferred.append(participant)
+            continue
+        write(participant, result, time.perf_counter() - start)
+
+    # Probe the participants refused by the open circuit again, waiting at most CIRCUIT_WAIT_BUDGET
+    # seconds in total for its cooldown. The rest keep their last known status.
+    wait_until = time.monotonic() + CIRCUIT_WAIT_BUDGET
+    for participant in deferred:
+        start = time.perf_counter()
+        result = ProbeResult(ProbeResult.TRANSIENT, "CircuitOpen")
+        if breaker.wait(wait_until):
+            result = probe(participant)
+        write(participant, result, time.perf_counter() - start)
+
 # Load API_KEY and API_SECRET from environment variables
 API_KEY = os.getenv('CODEFORCES_KEY')
 API_SECRET = os.getenv('CODEFORCES_SECRET')
@@ -321,6 +1038,8 @@ def generate_api_sig(rand: str, method_name: str, handles: str, time: int, secre
 
 def check_codeforces_users(handles):
     """Fetch Codeforces user data using the API."""
+    import requests
+
     random_string = generate_random_string(6)
 
     current_time = int(time.time())
@@ -333,6 +1052,7 @@ def check_codeforces_users(handles):
     url = f"{CODEFORCES_URL}?handles={handles_string}&apiKey={API_KEY}&time={current_time}&apiSig={random_string}{api_sig}"
 
     try:
+        count_request('codeforces')
         response = requests.get(url)
         
         # Print and return JSON response
@@ -362,6 +1082,8 @@ def process_codeforces(participants):
     remaining_handles = set(handles)
     all_valid_handles = set()
     all_batches_successful = True
+    # Handles of batches the API failed on, they got no answer and count as transient in the run report
+    failed_handles = set()
 
     # Split handles into batches of 300 and process them
     batches = [list(remaining_handles)[i:i + 300] for i in range(0, len(remaining_handles), 300)]
@@ -411,6 +1133,7 @@ def process_codeforces(participants):
             else:
                 logging.error(f"API Error: {response_json.get('comment', 'Unknown error')}")
                 all_batches_successful = False
+                failed_handles.update(batch)
                 break
             
             logging.debug(f"Remaining handles: {remaining_handles}")
@@ -421,8 +1144,11 @@ def process_codeforces(participants):
             participant.codeforces_handle = participant.codeforces_handle.replace(" ", "")
             if participant.codeforces_handle in all_valid_handles:
                 file.write(f"{participant.handle}, {participant.codeforces_handle}, {True}\n")
+                count_outcome('codeforces', participant.handle, ProbeResult.EXISTS)
             else:
                 file.write(f"{participant.handle}, {participant.codeforces_handle}, {False}\n")
+                outcome = ProbeResult.TRANSIENT if participant.codeforces_handle in failed_handles else ProbeResult.NOT_FOUND
+                count_outcome('codeforces', participant.handle, outcome)
     
     # Logging and printing final status
     if all_batches_successful:
@@ -458,6 +1184,8 @@ def process_codechef(participants):
     Returns:
     None
     """
+    from tqdm import tqdm
+
     logging.basicConfig(filename='codechef_debug.log', level=logging.DEBUG)
 
     # Initialize variables to store the last user's status and handle
@@ -465,22 +1193,12 @@ def process_codechef(participants):
     last_user_handle = None
 
     with tqdm(total=len(participants), desc="Processing CodeChef Handles", unit="participant") as pbar:
-        for participant in participants:
-            # Check CodeChef URL for each participant
-            logging.debug(f"Checking CodeChef URL for participant {participant.handle}")
-
-            if participant.codechef_handle != '#N/A':
-                # Check if CodeChef URL exists
-                codechef_url_exists, response_url = check_url_exists(
-                    "https://www.codechef.com/users/" + participant.codechef_handle)
-                logging.debug(f"CodeChef URL exists: {codechef_url_exists}, Response URL: {response_url}")
-
-                if not codechef_url_exists and participant.codechef_handle != '#N/A':
-                    # Retry checking CodeChef URL
-                    logging.debug(f"Retrying CodeChef URL check for participant {participant.handle}")
-                    codechef_url_exists, response_url = check_url_exists(
-                        "https://www.codechef.com/users/" + participant.codechef_handle)
-                    logging.debug(f"CodeChef URL retry: {codechef_url_exists}, Response URL: {response_url}")
+        # Iterate in priority order so a run cut short has checked the most valuable handles
+        for participant, result in profile_results(participants, 'codechef', 'codechef_handles.txt'):
+            # The CodeChef URL was checked (and retried) by profile_results
+            if result is not None:
+                # Transient failures keep the previously known status
+                codechef_url_exists = settle_result('codechef', participant, result)
 
                 # Write participant data to file codechef_url_exists
                 with open('codechef_handles.txt', 'a') as file:
@@ -511,6 +1229,8 @@ def process_hackerrank(participants):
     Returns:
     None
     """
+    from tqdm import tqdm
+
     # Configure logging
     logging.basicConfig(filename='hackerrank_debug.log', level=logging.DEBUG)
 
@@ -518,25 +1238,14 @@ def process_hackerrank(participants):
     last_user_status = None
     last_user_handle = None
 
-    # Iterate through the participants
-    with tqdm(participants, desc="Processing HackerRank Handles", unit="participant") as pbar:
-        for participant in pbar:
-            # Log the participant's HackerRank URL check
-            logging.debug(f"Checking HackerRank URL for participant {participant.handle}")
-
-            # Check if the HackerRank URL exists
-            if participant.hackerrank_handle != '#N/A': 
-
-                hackerrank_url_exists, response_url = check_url_exists(
-                    "https://www.hackerrank.com/profile/" + participant.hackerrank_handle)
-                logging.debug(f"HackerRank URL exists: {hackerrank_url_exists}, Response URL: {response_url}")
-
-                # Retry checking the HackerRank URL
-                if not hackerrank_url_exists and participant.hackerrank_handle != '#N/A':
-                    logging.debug(f"Retrying HackerRank URL check for participant {participant.handle}")
-                    hackerrank_url_exists, response_url = check_url_exists(
-                        "https://www.hackerrank.com/profile/" + participant.hackerrank_handle)
-                    logging.debug(f"HackerRank URL retry: {hackerrank_url_exists}, Response URL: {response_url}")
+    # Iterate in priority order so a run cut short has checked the most valuable handles
+    with tqdm(profile_results(participants, 'hackerrank', 'hackerrank_handles.txt'), total=len(participants),
+              desc="Processing HackerRank Handles", unit="participant") as pbar:
+        for participant, result in pbar:
+            # The HackerRank URL was checked (and retried) by profile_results
+            if result is not None:
+                # Transient failures keep the previously known status
+                hackerrank_url_exists = settle_result('hackerrank', participant, result)
 
                 # Write data to file
                 with open('hackerrank_handles.txt', 'a') as file:
@@ -560,6 +1269,8 @@ def process_hackerrank(participants):
 
 
 def load_excel_sheet(excel_sheet_path):
+    from openpyxl import load_workbook
+
     participants = []
     workbook = load_workbook(excel_sheet_path)
     sheet = workbook.active
@@ -614,85 +1325,203 @@ def load_csv_sheet(csv_sheet_path):
     return participants
 
 
-def combine_results(participants):
+# Per platform result files merged by combine_results, in output column order
+PLATFORM_RESULT_FILES = [
+    ('geeksforgeeks', 'geeksforgeeks_handles.txt'),
+    ('codeforces', 'codeforces_handles.txt'),
+    ('leetcode', 'leetcode_handles.txt'),
+    ('codechef', 'codechef_handles.txt'),
+    ('hackerrank', 'hackerrank_handles.txt'),
+]
+
+# Number of records held in memory at once by the external sort in combine_results
+COMBINE_CHUNK_SIZE = 100000
+
+
+def iter_csv_sheet(csv_sheet_path):
     """
-    Combines handle details from multiple files and writes them to a CSV file called participant_details.csv.
-    Each file contains handle details for a different platform, and the function loops through each file,
-    reads the handle details, and writes them to the CSV file.
+    Stream Participant objects from a CSV sheet without loading the whole sheet.
+
+    Args:
+    csv_sheet_path (str): The file path to the CSV sheet
+
+    Yields:
+    Participant: One Participant per row, in sheet order
+    """
+    with open(csv_sheet_path, 'r') as file:
+        for row in csv.reader(file):
+            if row[0] == "Roll number":  # Skip the header row
+                continue
+            if all(x == 'None' or x == '' for x in row):  # Stop if all cells in the row are empty
+                break
+            handle, geeksforgeeks_handle, codeforces_handle, leetcode_handle, codechef_handle, hackerrank_handle = row
+            yield Participant(handle, geeksforgeeks_handle, codeforces_handle, leetcode_handle, codechef_handle,
+                              hackerrank_handle)
+
+
+def external_sort(records, key, directory, chunk_size=None):
     """
+    Sort an iterable of string tuples with bounded memory.
 
-    # Open participant_details.csv for writing
-    with open('participant_details.csv', 'w', newline='') as csv_file:
-        writer = csv.writer(csv_file)
+    Records are sorted in chunks of chunk_size, each chunk is spilled to a run file in
+    directory and the runs are merged lazily with heapq.merge. The sort is stable.
 
-        # Write header row to CSV
-        writer.writerow(['Handle', 'GeeksForGeeks Handle', 'Codeforces Handle', 'LeetCode Handle', 'CodeChef Handle',
-                         'HackerRank Handle', 'GeeksForGeeks URL Exists', 'Codeforces URL Exists',
-                         'LeetCode URL Exists',
-                         'CodeChef URL Exists', 'HackerRank URL Exists'])
+    Args:
+    records (iterable): Tuples of strings
+    key (callable): Sort key for a record
+    directory (str): Directory for the run files
+    chunk_size (int): Maximum number of records held in memory, COMBINE_CHUNK_SIZE by default
 
-        # Iterate over all files and update participant object details
-        for participant in participants:
-            with open('geeksforgeeks_handles.txt', 'r') as file:
-                for line in file:
-                    handle, geeksforgeeks_handle, geeksforgeeks_url_exists = line.split(',')
-                    if handle == participant.handle:
-                        participant.geeksforgeeks_handle = geeksforgeeks_handle
-                        participant.geeksforgeeks_url_exists = geeksforgeeks_url_exists.strip()
-
-            with open('codeforces_handles.txt', 'r') as file:
-                for line in file:
-                    handle, codeforces_handle, codeforces_url_exists = line.split(',')
-                    if handle == participant.handle:
-                        participant.codeforces_handle = codeforces_handle
-                        participant.codeforces_url_exists = codeforces_url_exists.strip()
-
-            with open('leetcode_handles.txt', 'r') as file:
-                for line in file:
-                    handle, leetcode_handle, leetcode_url_exists = line.split(',')
-                    if handle == participant.handle:
-                        participant.leetcode_handle = leetcode_handle
-                        participant.leetcode_url_exists = leetcode_url_exists.strip()
-
-            with open('codechef_handles.txt', 'r') as file:
-                for line in file:
-                    handle, codechef_handle, codechef_url_exists = line.split(',')
-                    if handle == participant.handle:
-                        participant.codechef_handle = codechef_handle
-                        participant.codechef_url_exists = codechef_url_exists.strip()
-
-            with open('hackerrank_handles.txt', 'r') as file:
-                for line in file:
-                    handle, hackerrank_handle, hackerrank_url_exists = line.split(',')
-                    if handle == participant.handle:
-                        participant.hackerrank_handle = hackerrank_handle
-                        participant.hackerrank_url_exists = hackerrank_url_exists.strip()
-
-            # Write participant details to CSV
-            writer.writerow([participant.handle, participant.geeksforgeeks_handle, participant.codeforces_handle,
-                             participant.leetcode_handle, participant.codechef_handle, participant.hackerrank_handle,
-                             participant.geeksforgeeks_url_exists, participant.codeforces_url_exists,
-                             participant.leetcode_url_exists, participant.codechef_url_exists,
-                             participant.hackerrank_url_exists])
-
-    # remove all spaces in the csv file
-    with open('participant_details.csv', 'r') as file:
-        lines = file.readlines()
-    with open('participant_details.csv', 'w') as file:
-        for line in lines:
-            file.write(line.replace(' ', ''))
-    # move participant_details.csv to src/main/resources/participant_details.csv, if it exists over write
-    os.replace('participant_details.csv', 'src/main/resources/participant_details.csv')        
-    print("Participant details written to participant_details.csv")
+    Returns:
+    iterator: The records in sorted order
+    """
+    chunk_size = chunk_size or COMBINE_CHUNK_SIZE
+    runs = []
+    chunk = []
+
+    def spill():
+        chunk.sort(key=key)
+        run_path = os.path.join(directory, f'run-{len(runs)}.csv')
+        with open(run_path, 'w', newline='') as run_file:
+            csv.writer(run_file).writerows(chunk)
+        runs.append(run_path)
+        chunk.clear()
+
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            spill()
+    if chunk or not runs:
+        spill()
+
+    def read_run(run_path):
+        with open(run_path, 'r', newline='') as run_file:
+            for record in csv.reader(run_file):
+                yield tuple(record)
+
+    # heapq.merge keeps runs in order for equal keys, so the merge is stable like the chunk sorts
+    return heapq.merge(*(read_run(run_path) for run_path in runs), key=key)
+
+
+def latest_platform_results(file_name, directory):
+    """
+    Yield (handle, platform handle, url exists) from a platform result file, sorted by handle.
 
+    When a handle appears on several lines the last line wins, as in the original
+    participant-by-participant scan.
+    """
+    def records():
+        with open(file_name, 'r') as file:
+            for line_number, line in enumerate(file):
+                handle, platform_handle, url_exists = line.split(',')
+                yield handle, str(line_number), platform_handle, url_exists.strip()
+
+    sorted_records = external_sort(records(), lambda record: (record[0], int(record[1])),
+                                   os.path.join(directory, file_name))
+    previous = None
+    for record in sorted_records:
+        if previous is not None and previous[0] != record[0]:
+            yield previous[0], previous[2], previous[3]
+        previous = record
+    if previous is not None:
+        yield previous[0], previous[2], previous[3]
+
+
+def combine_results(participants, destination='src/main/resources/participant_details.csv'):
+    """
+    Combines handle details from multiple files and writes them to a CSV file called participant_details.csv.
 
-def main():
-    if len(sys.argv) != 3:
-        print("Usage: python script.py <excel/csv file path> <platform>")
-        return
+    The participants and every platform result file are sorted by handle with an external sort
+    and merge-joined in a single pass, then the joined rows are sorted back into sheet order.
+    Memory use is bounded by COMBINE_CHUNK_SIZE whatever the cohort size. Spaces are removed
+    from each field as it is written and the CSV is written to a temporary file next to the
+    destination before being moved over it.
+
+    Args:
+    participants (iterable): Participant objects in sheet order, may be a generator
+    destination (str): Path of the combined CSV file
+
+    Returns:
+    None
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        for _, file_name in PLATFORM_RESULT_FILES:
+            os.makedirs(os.path.join(directory, file_name))
+        os.makedirs(os.path.join(directory, 'participants'))
+        os.makedirs(os.path.join(directory, 'joined'))
+
+        # Participants sorted by handle, keeping the sheet position to restore the order later
+        sheet_records = ((participant.handle, str(position), participant.geeksforgeeks_handle,
+                          participant.codeforces_handle, participant.leetcode_handle, participant.codechef_handle,
+                          participant.hackerrank_handle)
+                         for position, participant in enumerate(participants))
+        sorted_participants = external_sort(sheet_records, lambda record: (record[0], int(record[1])),
+                                            os.path.join(directory, 'participants'))
+
+        platform_streams = [latest_platform_results(file_name, directory) for _, file_name in PLATFORM_RESULT_FILES]
+        platform_current = [next(stream, None) for stream in platform_streams]
+
+        def joined_rows():
+            for record in sorted_participants:
+                handle, position = record[0], record[1]
+                platform_handles = list(record[2:])
+                url_exists = [False] * len(platform_streams)
+                for index, stream in enumerate(platform_streams):
+                    # Advance this platform past handles that sort before the participant
+                    while platform_current[index] is not None and platform_current[index][0] < handle:
+                        platform_current[index] = next(stream, None)
+                    current = platform_current[index]
+                    if current is not None and current[0] == handle:
+                        platform_handles[index] = current[1]
+                        url_exists[index] = current[2]
+                yield (position, handle, *platform_handles, *(str(value) for value in url_exists))
+
+        rows_in_sheet_order = external_sort(joined_rows(), lambda record: int(record[0]),
+                                            os.path.join(directory, 'joined'))
+
+        temp_path = destination + '.tmp'
+        with open(temp_path, 'w', newline='') as csv_file:
+            writer = csv.writer(csv_file)
+
+            # Write header row to CSV
+            writer.writerow(['Handle', 'GeeksForGeeksHandle', 'CodeforcesHandle', 'LeetCodeHandle', 'CodeChefHandle',
+                             'HackerRankHandle', 'GeeksForGeeksURLExists', 'CodeforcesURLExists', 'LeetCodeURLExists',
+                             'CodeChefURLExists', 'HackerRankURLExists'])
+
+            # Write participant details to CSV, removing all spaces from each field
+            for row in rows_in_sheet_order:
+                writer.writerow([field.replace(' ', '') for field in row[1:]])
+
+    # move the combined file over src/main/resources/participant_details.csv, if it exists over write
+    os.replace(temp_path, destination)
+    print(f"Participant details written to {destination}")
+
+
+def positive_float(value):
+    """argparse type for options that must be greater than zero, such as --rate."""
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
 
-    file_path = sys.argv[1]
-    platform = sys.argv[2].lower()
+
+def main():
+    global deadline, executor, workers, rate_limiter
+
+    parser = argparse.ArgumentParser(usage="python main.py <excel/csv file path> <platform> [options]")
+    parser.add_argument("file_path", help="Excel (.xlsx) or CSV (.csv) sheet of participants")
+    parser.add_argument("platform", help="GeeksForGeeks, Codeforces, LeetCode, CodeChef, HackerRank, All or Combine")
+    parser.add_argument("--deadline", type=float, default=None,
+                        help="Time budget in seconds, no new handles are checked once it is spent")
+    parser.add_argument("--executor", choices=['sequential', 'threads'], default='sequential',
+                        help="How GeeksForGeeks, CodeChef and HackerRank profiles are probed")
+    parser.add_argument("--workers", type=int, default=8, help="Number of threads for --executor threads")
+    parser.add_argument("--rate", type=positive_float, default=THREAD_REQUESTS_PER_SECOND,
+                        help="Requests per second shared by all threads for --executor threads")
+    args = parser.parse_args()
+
+    file_path = args.file_path
+    platform = args.platform.lower()
 
     platforms = ['geeksforgeeks', 'codeforces', 'leetcode', 'codechef', 'hackerrank']
 
@@ -705,7 +1534,18 @@ def main():
         print("Invalid file path. Please provide a valid file path.")
         return
 
-    if file_path.endswith('.xlsx'):
+    if args.deadline is not None:
+        deadline = time.monotonic() + args.deadline
+
+    if args.executor == 'threads':
+        executor = 'threads'
+        workers = max(args.workers, 1)
+        rate_limiter = RateLimit(args.rate)
+
+    if platform == 'combine' and file_path.endswith('.csv'):
+        # combine streams the sheet, so it never holds the whole cohort in memory
+        participants = iter_csv_sheet(file_path)
+    elif file_path.endswith('.xlsx'):
         participants = load_excel_sheet(file_path)
     elif file_path.endswith('.csv'):
         participants = load_csv_sheet(file_path)
@@ -713,18 +1553,42 @@ def main():
         print("Invalid file format. Please provide an Excel (.xlsx) or CSV (.csv) file.")
         return
 
-    if platform == 'geeksforgeeks' or platform == 'all':
-        process_geeksforgeeks(participants)
-    if platform == 'codeforces' or platform == 'all':
-        process_codeforces(participants)
-    if platform == 'leetcode' or platform == 'all':
-        process_leetcode(participants)
-    if platform == 'codechef' or platform == 'all':
-        process_codechef(participants)
-    if platform == 'hackerrank' or platform == 'all':
-        process_hackerrank(participants)
-    if platform == 'combine':
-        combine_results(participants)
+    # Profile pages checked on earlier runs are revalidated with conditional requests
+    load_validators()
+    # Results of earlier runs decide which handles are checked first
+    load_state()
+    # Last committed results, kept for handles that only get transient failures this run
+    load_published_status()
+
+    processors = [
+        ('geeksforgeeks', process_geeksforgeeks),
+        ('codeforces', process_codeforces),
+        ('leetcode', process_leetcode),
+        ('codechef', process_codechef),
+        ('hackerrank', process_hackerrank),
+    ]
+
+    run_start = time.perf_counter()
+    try:
+        for name, process in processors:
+            if platform == name or platform == 'all':
+                start = time.perf_counter()
+                try:
+                    process(participants)
+                finally:
+                    with stats_lock:
+                        platform_stats(name)['wall_time'] += time.perf_counter() - start
+        if platform == 'combine':
+            combine_results(participants)
+    finally:
+        # Keep what was learned even when a platform raises part way through
+        if verification_state:
+            save_state()
+        if conditional_stats:
+            save_validators()
+            print_conditional_report()
+        if run_stats:
+            write_report(time.perf_counter() - run_start)
 
 
 if __name__ == "__main__":